@@ -28,6 +28,7 @@
 import re
 import logging
 import math
+import sys
 from fractions import Fraction
 import typing
 from dataclasses import dataclass
@@ -40,14 +41,31 @@
 
 LOGGER = logging.getLogger(__name__)
 
+_INTEGER_PAIR_RE = re.compile(r"(\d+) (\d+)")
+
+def _parse_integer_pair(value: str) -> typing.Optional[typing.Tuple[int, int]]:
+  '''Parses two non-negative integers separated by a single space at the start of `value`, or returns
+  None if `value` does not have that syntax
+  '''
+  (first, sep, second) = value.partition(" ")
+
+  if sep and first.isdecimal() and second.isdecimal():
+    return (int(first), int(second))
+
+  # characters following the second integer, e.g. trailing whitespace, are ignored
+
+  m = _INTEGER_PAIR_RE.match(value)
+
+  return (int(m.group(1)), int(m.group(2))) if m else None
+
 class XMLIDAttribute:
   '''xml:id attribute
   '''
 
-  qn = f'{{{ns.XML}}}id'
+  qn = sys.intern(f'{{{ns.XML}}}id')
 
   @staticmethod
-  def extract(ttml_element):
+  def extract(ttml_element) -> typing.Optional[str]:
     return ttml_element.attrib.get(XMLIDAttribute.qn)
 
   @staticmethod
@@ -58,10 +76,10 @@ class XMLLangAttribute:
   '''xml:lang attribute
   '''
 
-  qn = f'{{{ns.XML}}}lang'
+  qn = sys.intern(f'{{{ns.XML}}}lang')
 
   @staticmethod
-  def extract(ttml_element):
+  def extract(ttml_element) -> typing.Optional[str]:
     return ttml_element.attrib.get(XMLLangAttribute.qn)
 
   @staticmethod
@@ -72,10 +90,12 @@ class XMLSpaceAttribute:
   '''xml:space attribute
   '''
 
-  qn = f'{{{ns.XML}}}space'
+  qn = sys.intern(f'{{{ns.XML}}}space')
+
+  _WHITE_SPACE_HANDLING = {wsh.value: wsh for wsh in model.WhiteSpaceHandling}
 
   @staticmethod
-  def extract(ttml_element):
+  def extract(ttml_element) -> typing.Optional[model.WhiteSpaceHandling]:
 
     value = ttml_element.attrib.get(XMLSpaceAttribute.qn)
 
@@ -83,9 +103,9 @@ def extract(ttml_element):
 
     if value is not None:
 
-      try: 
-        r = model.WhiteSpaceHandling(value)
-      except ValueError:
+      r = XMLSpaceAttribute._WHITE_SPACE_HANDLING.get(value)
+
+      if r is None:
         LOGGER.error("Bad xml:space value (%s)", value)
     
     return r
@@ -113,9 +133,7 @@ class CellResolutionAttribute:
   '''ttp:cellResolution attribute
   '''
 
-  qn = f"{{{ns.TTP}}}cellResolution"
-
-  _CELL_RESOLUTION_RE = re.compile(r"(\d+) (\d+)")
+  qn = sys.intern(f"{{{ns.TTP}}}cellResolution")
 
   @staticmethod
   def extract(ttml_element) -> model.CellResolutionType:
@@ -124,11 +142,11 @@ def extract(ttml_element) -> model.CellResolutionType:
 
     if cr is not None:
 
-      m = CellResolutionAttribute._CELL_RESOLUTION_RE.match(cr)
+      cr_pair = _parse_integer_pair(cr)
 
-      if m is not None:
+      if cr_pair is not None:
 
-        return model.CellResolutionType(columns=int(m.group(1)), rows=int(m.group(2)))
+        return model.CellResolutionType(columns=cr_pair[0], rows=cr_pair[1])
 
       LOGGER.error("ttp:cellResolution invalid syntax")
 
@@ -144,7 +162,7 @@ class ExtentAttribute:
   '''ttp:extent attribute on \\<tt\\>
   '''
 
-  qn = f"{{{ns.TTS}}}extent"
+  qn = sys.intern(f"{{{ns.TTS}}}extent")
 
   @staticmethod
   def extract(ttml_element) -> typing.Optional[model.PixelResolutionType]:
@@ -178,7 +196,7 @@ class ActiveAreaAttribute:
   '''ittp:activeArea attribute on \\<tt\\>
   '''
 
-  qn = f"{{{ns.ITTP}}}activeArea"
+  qn = sys.intern(f"{{{ns.ITTP}}}activeArea")
 
   @staticmethod
   def extract(ttml_element) -> typing.Optional[model.ActiveAreaType]:
@@ -228,7 +246,7 @@ class TickRateAttribute:
   '''ttp:tickRate attribute
   '''
 
-  qn = f"{{{ns.TTP}}}tickRate"
+  qn = sys.intern(f"{{{ns.TTP}}}tickRate")
 
   _TICK_RATE_RE = re.compile(r"(\d+)")
 
@@ -255,9 +273,7 @@ class AspectRatioAttribute:
   '''ittp:aspectRatio attribute
   '''
 
-  qn = f"{{{ns.ITTP}}}aspectRatio"
-
-  _re = re.compile(r"(\d+) (\d+)")
+  qn = sys.intern(f"{{{ns.ITTP}}}aspectRatio")
 
   @staticmethod
   def extract(ttml_element) -> typing.Optional[Fraction]:
@@ -267,15 +283,15 @@ def extract(ttml_element) -> typing.Optional[Fraction]:
     if ar_raw is None:
       return None
 
-    m = AspectRatioAttribute._re.match(ar_raw)
+    ar_pair = _parse_integer_pair(ar_raw)
 
-    if m is None:
+    if ar_pair is None:
       LOGGER.error("ittp:aspectRatio invalid syntax")
       return None
 
     try:
 
-      return Fraction(int(m.group(1)), int(m.group(2)))
+      return Fraction(*ar_pair)
 
     except ZeroDivisionError:
 
@@ -287,9 +303,7 @@ class DisplayAspectRatioAttribute:
   '''ttp:displayAspectRatio attribute
   '''
 
-  qn = f"{{{ns.TTP}}}displayAspectRatio"
-
-  _re = re.compile(r"(\d+) (\d+)")
+  qn = sys.intern(f"{{{ns.TTP}}}displayAspectRatio")
 
   @staticmethod
   def extract(ttml_element) -> typing.Optional[Fraction]:
@@ -299,15 +313,15 @@ def extract(ttml_element) -> typing.Optional[Fraction]:
     if ar_raw is None:
       return None
 
-    m = DisplayAspectRatioAttribute._re.match(ar_raw)
+    ar_pair = _parse_integer_pair(ar_raw)
 
-    if m is None:
+    if ar_pair is None:
       LOGGER.error("ttp:displayAspectRatio invalid syntax")
       return None
 
     try:
 
-      return Fraction(int(m.group(1)), int(m.group(2)))
+      return Fraction(*ar_pair)
 
     except ZeroDivisionError:
 
@@ -326,14 +340,12 @@ class FrameRateAttribute:
   '''ttp:frameRate and ttp:frameRateMultiplier attribute
   '''
 
-  frame_rate_qn = f"{{{ns.TTP}}}frameRate"
+  frame_rate_qn = sys.intern(f"{{{ns.TTP}}}frameRate")
 
-  frame_rate_multiplier_qn = f"{{{ns.TTP}}}frameRateMultiplier"
+  frame_rate_multiplier_qn = sys.intern(f"{{{ns.TTP}}}frameRateMultiplier")
 
   _FRAME_RATE_RE = re.compile(r"(\d+)")
 
-  _FRAME_RATE_MULT_RE = re.compile(r"(\d+) (\d+)")
-
   @staticmethod
   def extract(ttml_element) -> Fraction:
 
@@ -363,11 +375,11 @@ def extract(ttml_element) -> Fraction:
 
     if frm_raw is not None:
 
-      m = FrameRateAttribute._FRAME_RATE_MULT_RE.match(frm_raw)
+      frm_pair = _parse_integer_pair(frm_raw)
 
-      if m is not None:
+      if frm_pair is not None:
 
-        frm = Fraction(int(m.group(1)), int(m.group(2)))
+        frm = Fraction(*frm_pair)
 
       else:
 
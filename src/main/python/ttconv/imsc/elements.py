@@ -26,10 +26,12 @@
 '''Process TTML elements'''
 
 from __future__ import annotations
+import collections
 import logging
 from fractions import Fraction
 import typing
 import numbers
+import sys
 import xml.etree.ElementTree as et
 import ttconv.model as model
 import ttconv.style_properties as model_styles
@@ -48,6 +50,22 @@ class TTMLElement:
   class ParsingContext(imsc_styles.StyleParsingContext):
     '''State information when parsing a TTML element'''
 
+    __slots__ = (
+      "style_elements",
+      "temporal_context",
+      "ttml_class",
+      "lang",
+      "space",
+      "time_container",
+      "explicit_begin",
+      "implicit_begin",
+      "desired_begin",
+      "explicit_end",
+      "implicit_end",
+      "desired_end",
+      "explicit_dur"
+      )
+
     def __init__(self, ttml_class: typing.Type[TTMLElement], parent_ctx: typing.Optional[TTMLElement.ParsingContext] = None):
 
       self.doc = parent_ctx.doc if parent_ctx is not None else model.ContentDocument()
@@ -78,21 +96,26 @@ def __init__(self, ttml_class: typing.Type[TTMLElement], parent_ctx: typing.Opti
 
       self.explicit_dur: typing.Optional[Fraction] = None
 
-    def process_lang_attribute(self, parent_ctx: TTMLElement.ParsingContext, xml_elem):
+    def process_lang_attribute(self, parent_ctx: TTMLElement.ParsingContext, xml_elem: et.Element):
       '''Processes the xml:lang attribute, including inheritance from the parent
       '''
-      lang_attr_value = imsc_attr.XMLLangAttribute.extract(xml_elem)
+      lang_attr_value = xml_elem.attrib.get(imsc_attr.XMLLangAttribute.qn)
       self.lang = lang_attr_value if lang_attr_value is not None else parent_ctx.lang
 
-    def process_space_attribute(self, parent_ctx: TTMLElement.ParsingContext, xml_elem):
+    def process_space_attribute(self, parent_ctx: TTMLElement.ParsingContext, xml_elem: et.Element):
       '''Processes the xml:space attribute, including inheritance from the parent
       '''
-      space_attr_value = imsc_attr.XMLSpaceAttribute.extract(xml_elem)
+      # the value is only validated when present, which avoids a function call for most elements
+
+      space_attr_value = imsc_attr.XMLSpaceAttribute.extract(xml_elem) \
+        if imsc_attr.XMLSpaceAttribute.qn in xml_elem.attrib else None
       self.space = space_attr_value if space_attr_value is not None else parent_ctx.space
 
   class WritingContext:
     '''State information when writing a TTML element'''
 
+    __slots__ = ("temporal_context",)
+
     def __init__(self, frame_rate: Fraction, time_expression_syntax: imsc_attr.TimeExpressionSyntaxEnum):
       self.temporal_context = imsc_attr.TemporalAttributeWritingContext(
         frame_rate=frame_rate,
@@ -113,19 +136,18 @@ class TTElement(TTMLElement):
   class ParsingContext(TTMLElement.ParsingContext):
     '''State information when parsing a <tt> element'''
 
-  qn = f"{{{xml_ns.TTML}}}tt"
+    __slots__ = ()
+
+  qn = sys.intern(f"{{{xml_ns.TTML}}}tt")
 
   @staticmethod
   def is_instance(xml_elem) -> bool:
     return xml_elem.tag == TTElement.qn
 
   @staticmethod
-  def from_xml(
-    _parent_ctx: typing.Optional[TTMLElement.ParsingContext],
-    xml_elem: et.Element,
-    progress_callback: typing.Callable[[numbers.Real], typing.NoReturn] = None
-  ) -> TTElement.ParsingContext:
-    '''`_parent_ctx` is ignored and can be set to `None`
+  def make_parsing_context(xml_elem: et.Element) -> TTElement.ParsingContext:
+    '''Creates the parsing context of the <tt> element `xml_elem` and processes its attributes, but
+    not its children elements.
     '''
 
     tt_ctx = TTElement.ParsingContext(TTElement)
@@ -180,42 +202,82 @@ def from_xml(
 
     tt_ctx.temporal_context.tick_rate = imsc_attr.TickRateAttribute.extract(xml_elem)
 
+    return tt_ctx
+
+  @staticmethod
+  def from_xml(
+    _parent_ctx: typing.Optional[TTMLElement.ParsingContext],
+    xml_elem: et.Element,
+    progress_callback: typing.Callable[[numbers.Real], typing.NoReturn] = None
+  ) -> TTElement.ParsingContext:
+    '''`_parent_ctx` is ignored and can be set to `None`
+    '''
+
+    tt_ctx = TTElement.make_parsing_context(xml_elem)
+
     # process head and body children elements
 
-    has_body = False
-    has_head = False
+    processed_children = set()
 
     for child_element in xml_elem:
 
-      if BodyElement.is_instance(child_element):
+      child_handler = TTElement.child_handler(processed_children, child_element)
 
-        if not has_body:
+      if child_handler is not None:
+        child_handler(tt_ctx, child_element, progress_callback)
 
-          has_body = True
+    return tt_ctx
 
-          body_element = ContentElement.from_xml(tt_ctx, child_element)
+  @staticmethod
+  def child_handler(
+    processed_children: typing.Set[str],
+    xml_elem: et.Element
+  ) -> typing.Optional[typing.Callable]:
+    '''Returns the handler of `xml_elem`, a child of the <tt> element, or `None` if `xml_elem` is
+    neither a <head> nor a <body> element or if an element of the same name is listed in
+    `processed_children`. `processed_children` is updated accordingly.
+    '''
 
-          tt_ctx.doc.set_body(body_element.model_element if body_element is not None else None)
+    child_entry = _TT_CHILDREN.get(xml_elem.tag)
 
-          progress_callback(1)
+    if child_entry is None:
+      return None
 
-        else:
-          LOGGER.error("More than one body element present")
+    child_name, child_handler = child_entry
 
-      elif HeadElement.is_instance(child_element):
+    if child_name in processed_children:
+      LOGGER.error("More than one %s element present", child_name)
+      return None
 
-        if not has_head:
+    processed_children.add(child_name)
 
-          has_head = True
+    return child_handler
 
-          HeadElement.from_xml(tt_ctx, child_element)
+  @staticmethod
+  def process_head_element(
+    tt_ctx: TTElement.ParsingContext,
+    xml_elem: et.Element,
+    progress_callback: typing.Callable[[numbers.Real], typing.NoReturn]
+  ):
+    '''Processes the <head> element `xml_elem`, which is a child of the <tt> element
+    '''
+    HeadElement.from_xml(tt_ctx, xml_elem)
 
-          progress_callback(0.5)
+    progress_callback(0.5)
 
-        else:
-          LOGGER.error("More than one head element present")
+  @staticmethod
+  def process_body_element(
+    tt_ctx: TTElement.ParsingContext,
+    xml_elem: et.Element,
+    progress_callback: typing.Callable[[numbers.Real], typing.NoReturn]
+  ):
+    '''Processes the <body> element `xml_elem`, which is a child of the <tt> element
+    '''
+    body_element = ContentElement.from_xml(tt_ctx, xml_elem)
 
-    return tt_ctx
+    tt_ctx.doc.set_body(body_element.model_element if body_element is not None else None)
+
+    progress_callback(1)
 
   @staticmethod
   def from_model(
@@ -295,7 +357,9 @@ class ParsingContext(TTMLElement.ParsingContext):
     '''Maintains state when parsing a <head> element
     '''
 
-  qn = f"{{{xml_ns.TTML}}}head"
+    __slots__ = ()
+
+  qn = sys.intern(f"{{{xml_ns.TTML}}}head")
 
   @staticmethod
   def is_instance(xml_elem) -> bool:
@@ -320,40 +384,24 @@ def from_xml(
 
     # process layout and styling children elements
 
-    has_layout = False
-    has_styling = False
+    processed_children = set()
     
     for child_element in xml_elem:
 
-      if LayoutElement.is_instance(child_element):
+      child_entry = _HEAD_CHILDREN.get(child_element.tag)
 
-        if not has_layout:
-
-          has_layout = True
-
-          LayoutElement.from_xml(
-            head_ctx,
-            child_element
-          )
-
-        else:
-
-          LOGGER.error("Multiple layout elements")
-
-      elif StylingElement.is_instance(child_element):
+      if child_entry is None:
+        continue
 
-        if not has_styling:
+      child_name, child_handler = child_entry
 
-          has_styling = True
+      if child_name in processed_children:
+        LOGGER.error("Multiple %s elements", child_name)
+        continue
 
-          StylingElement.from_xml(
-            head_ctx,
-            child_element
-          )
+      processed_children.add(child_name)
 
-        else:
-
-          LOGGER.error("Multiple styling elements")
+      child_handler(head_ctx, child_element)
 
     return head_ctx
 
@@ -393,7 +441,9 @@ class ParsingContext(TTMLElement.ParsingContext):
     '''Maintains state when parsing a <layout> element
     '''
 
-  qn = f"{{{xml_ns.TTML}}}layout"
+    __slots__ = ()
+
+  qn = sys.intern(f"{{{xml_ns.TTML}}}layout")
 
   @staticmethod
   def is_instance(xml_elem) -> bool:
@@ -461,6 +511,8 @@ class ParsingContext(TTMLElement.ParsingContext):
     '''Maintains state when parsing a <styling> element
     '''
 
+    __slots__ = ()
+
     def merge_chained_styles(self, style_element: StyleElement):
       '''Flattens Chained Referential Styling of the target `style_element` by specifying
       the style properties of the referenced style elements directly in the target element
@@ -479,7 +531,7 @@ def merge_chained_styles(self, style_element: StyleElement):
           style_element.styles.setdefault(style_prop, value)
 
 
-  qn = f"{{{xml_ns.TTML}}}styling"
+  qn = sys.intern(f"{{{xml_ns.TTML}}}styling")
 
   @staticmethod
   def is_instance(xml_elem) -> bool:
@@ -500,11 +552,13 @@ def from_xml(
 
     for child_xml_elem in xml_elem:
 
-      if InitialElement.is_instance(child_xml_elem):
+      child_tag = child_xml_elem.tag
+
+      if child_tag == InitialElement.qn:
 
         InitialElement.from_xml(styling_ctx, child_xml_elem)
 
-      elif StyleElement.is_instance(child_xml_elem):
+      elif child_tag == StyleElement.qn:
         
         style_element = StyleElement.from_xml(styling_ctx, child_xml_elem)
 
@@ -561,13 +615,15 @@ class ParsingContext(TTMLElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
 
+    __slots__ = ("styles", "style_refs", "id")
+
     def __init__(self, parent_ctx: typing.Optional[TTMLElement.ParsingContext] = None):
       self.styles: typing.Dict[model_styles.StyleProperty, typing.Any] = dict()
       self.style_refs: typing.Optional[typing.List[str]] = None
       self.id: typing.Optional[str] = None
       super().__init__(StyleElement, parent_ctx)
 
-  qn = f"{{{xml_ns.TTML}}}style"
+  qn = sys.intern(f"{{{xml_ns.TTML}}}style")
 
   @staticmethod
   def is_instance(xml_elem) -> bool:
@@ -586,16 +642,17 @@ def from_xml(
 
     # collect all specified style attributes
 
-    for attr in xml_elem.attrib:
-      prop = StyleProperties.BY_QNAME.get(attr)
+    by_qname = StyleProperties.BY_QNAME
+
+    for attr, attr_value in xml_elem.attrib.items():
+      prop = by_qname.get(attr)
 
       if prop is None:
         continue
 
       try:
 
-        model_prop, model_value = prop.to_model(style_ctx, xml_elem)
-        style_ctx.styles[model_prop] = model_value
+        style_ctx.styles[prop.model_prop] = prop.extract(style_ctx, attr_value)
 
       except ValueError:
 
@@ -634,7 +691,9 @@ class ParsingContext(TTMLElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
 
-  qn = f"{{{xml_ns.TTML}}}initial"
+    __slots__ = ()
+
+  qn = sys.intern(f"{{{xml_ns.TTML}}}initial")
 
   @staticmethod
   def is_instance(xml_elem) -> bool:
@@ -653,9 +712,11 @@ def from_xml(
 
     # collect the specified style attributes
 
-    for attr in xml_elem.attrib:
+    by_qname = StyleProperties.BY_QNAME
 
-      prop = StyleProperties.BY_QNAME.get(attr)
+    for attr, attr_value in xml_elem.attrib.items():
+
+      prop = by_qname.get(attr)
 
       if prop is None:
 
@@ -666,9 +727,7 @@ def from_xml(
         # set the initial value on the data model ContentDocument (the data model does have 
         # a distinct <initial> element)
 
-        model_prop, model_value = prop.to_model(initial_ctx, xml_elem)
-
-        initial_ctx.doc.put_initial_value(model_prop, model_value)
+        initial_ctx.doc.put_initial_value(prop.model_prop, prop.extract(initial_ctx, attr_value))
 
       except (ValueError, TypeError):
 
@@ -701,6 +760,9 @@ class ContentElement(TTMLElement):
   class ParsingContext(TTMLElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
+
+    __slots__ = ("children", "model_element", "is_inline_animation_complete", "has_text_nodes")
+
     def __init__(
         self,
         ttml_class: typing.Optional[typing.Type[ContentElement]],
@@ -709,9 +771,11 @@ def __init__(
       ):
       self.children: typing.List[model.ContentElement] = []
       self.model_element: model.ContentElement = model_element
+      self.is_inline_animation_complete: bool = False
+      self.has_text_nodes: bool = False
       super().__init__(ttml_class, parent_ctx)
 
-    def process_region_property(self, xml_elem):
+    def process_region_property(self, xml_elem: et.Element):
       '''Reads and processes the `region` attribute
       '''
       rid = imsc_attr.RegionAttribute.extract(xml_elem)
@@ -726,7 +790,7 @@ def process_region_property(self, xml_elem):
       else:
         LOGGER.warning("Element references unknown region")
 
-    def process_referential_styling(self, xml_elem):
+    def process_referential_styling(self, xml_elem: et.Element):
       '''Processes referential styling
       '''
       for style_ref in reversed(imsc_attr.StyleAttribute.extract(xml_elem)):
@@ -740,25 +804,25 @@ def process_referential_styling(self, xml_elem):
           if not self.model_element.has_style(model_prop):
             self.model_element.set_style(model_prop, value)
 
-    def process_specified_styling(self, xml_elem):
+    def process_specified_styling(self, xml_elem: et.Element):
       '''Processes specified styling
       '''
-      for attr in xml_elem.attrib:
-        prop = StyleProperties.BY_QNAME.get(attr)
+      by_qname = StyleProperties.BY_QNAME
+
+      for attr, attr_value in xml_elem.attrib.items():
+        prop = by_qname.get(attr)
 
         if prop is None:
           continue
 
         try:
-          model_prop, model_value = prop.to_model(self, xml_elem)
-
-          self.model_element.set_style(model_prop, model_value)
+          self.model_element.set_style(prop.model_prop, prop.extract(self, attr_value))
 
         except ValueError:
 
           LOGGER.error("Error reading style property: %s", prop.__name__)
 
-    def process_set_style_properties(self, parent_ctx: ContentElement.ParsingContext, xml_elem):
+    def process_set_style_properties(self, parent_ctx: ContentElement.ParsingContext, xml_elem: et.Element):
       '''Processes style properties on `<set>` element
       '''
       if parent_ctx.model_element is None:
@@ -769,134 +833,188 @@ def process_set_style_properties(self, parent_ctx: ContentElement.ParsingContext
         LOGGER.error("Set parent is not a content element")
         return
 
-      for attr in xml_elem.attrib:
-        prop = StyleProperties.BY_QNAME.get(attr)
+      by_qname = StyleProperties.BY_QNAME
+
+      for attr, attr_value in xml_elem.attrib.items():
+        prop = by_qname.get(attr)
         if prop is not None:
           try:
-            model_prop, model_value = prop.to_model(self, xml_elem)
             parent_ctx.model_element.add_animation_step(
               model.DiscreteAnimationStep(
-                model_prop,
+                prop.model_prop,
                 self.desired_begin,
                 self.desired_end,
-                model_value
+                prop.extract(self, attr_value)
               )
             )
             break
           except ValueError:
             LOGGER.error("Error reading style property: %s", prop.__name__)
 
-    def process_lang_attribute(self, parent_ctx: TTMLElement.ParsingContext, xml_elem):
+    def process_lang_attribute(self, parent_ctx: TTMLElement.ParsingContext, xml_elem: et.Element):
       super().process_lang_attribute(parent_ctx, xml_elem)
       self.model_element.set_lang(self.lang)
 
-    def process_space_attribute(self, parent_ctx: TTMLElement.ParsingContext, xml_elem):
+    def process_space_attribute(self, parent_ctx: TTMLElement.ParsingContext, xml_elem: et.Element):
       super().process_space_attribute(parent_ctx, xml_elem)
       self.model_element.set_space(self.space)
 
-    # pylint: disable=too-many-branches
-
     def process(self, parent_ctx: TTMLElement.ParsingContext, xml_elem: et.Element):
-      '''Generic processing applicable to TTML elements rooted in `region` and `body` elements
+      '''Generic processing applicable to TTML elements rooted in `region` and `body` elements.
+
+      The subtree rooted at `xml_elem` is traversed iteratively, using an explicit stack, so that
+      deeply nested documents do not exhaust the Python call stack.
+      '''
+      self.process_begin(parent_ctx, xml_elem)
+
+      stack = collections.deque([(self, parent_ctx, xml_elem, iter(xml_elem))])
+
+      while stack:
+
+        ctx, ctx_parent, ctx_xml_elem, xml_children = stack[-1]
+
+        child_xml_elem = next(xml_children, None)
+
+        if child_xml_elem is None:
+
+          # all children have been processed
+
+          stack.pop()
+
+          ctx.process_end(ctx_parent, ctx_xml_elem)
+
+          if stack:
+            stack[-1][0].process_child(ctx, ctx_xml_elem)
+
+          continue
+
+        if issubclass(ctx.ttml_class, RegionElement) and StyleElement.is_instance(child_xml_elem):
+          # process nest styling, which is specific to region elements, and does not affect temporal
+          # processing
+          StyleElement.from_xml(ctx, child_xml_elem)
+          continue
+
+        child_class = ContentElement.get_ttml_class(child_xml_elem)
+
+        child_ctx = child_class.make_parsing_context(ctx, child_xml_elem) if child_class is not None else None
+
+        if child_ctx is None:
+          ctx.process_child(None, child_xml_elem)
+          continue
+
+        child_ctx.process_begin(ctx, child_xml_elem)
+
+        stack.append((child_ctx, ctx, child_xml_elem, iter(child_xml_elem)))
+
+    def process_begin(self, parent_ctx: TTMLElement.ParsingContext, xml_elem: et.Element):
+      '''Processing performed before the children of `xml_elem` are processed
       '''
       self.process_lang_attribute(parent_ctx, xml_elem)
 
       self.process_space_attribute(parent_ctx, xml_elem)
 
-      if self.ttml_class.has_region:
+      # elements without attributes, e.g. <br/>, keep the default region and temporal attribute values
+
+      has_attributes = len(xml_elem.attrib) > 0
+
+      if has_attributes and self.ttml_class.has_region:
         self.process_region_property(xml_elem)
 
       # temporal processing. Sequential time containers are converted to parallel time containers since the data model does not
       # support the former.
 
-      self.time_container = imsc_attr.TimeContainerAttribute.extract(xml_elem)
+      if has_attributes:
 
-      self.explicit_begin = imsc_attr.BeginAttribute.extract(self.temporal_context, xml_elem)
+        self.time_container = imsc_attr.TimeContainerAttribute.extract(xml_elem)
 
-      self.explicit_dur = imsc_attr.DurAttribute.extract(self.temporal_context, xml_elem)
+        self.explicit_begin = imsc_attr.BeginAttribute.extract(self.temporal_context, xml_elem)
 
-      self.explicit_end = imsc_attr.EndAttribute.extract(self.temporal_context, xml_elem)
+        self.explicit_dur = imsc_attr.DurAttribute.extract(self.temporal_context, xml_elem)
 
-      if parent_ctx.time_container.is_par():
+        self.explicit_end = imsc_attr.EndAttribute.extract(self.temporal_context, xml_elem)
+
+      is_parent_par = parent_ctx.time_container.is_par()
+
+      if is_parent_par:
         self.implicit_begin = Fraction(0)
       else:      
         self.implicit_begin = parent_ctx.implicit_end - parent_ctx.desired_begin
       
       self.desired_begin = self.implicit_begin + (self.explicit_begin if self.explicit_begin is not None else Fraction(0))
 
-      if issubclass(self.ttml_class, (BrElement, RegionElement, SetElement)) and \
-        parent_ctx.time_container.is_par():
+      if is_parent_par and issubclass(self.ttml_class, (BrElement, RegionElement, SetElement)):
         # br, region and set elements have indefinite duration in parallel time containers
 
         self.implicit_end = None
       else:
         self.implicit_end = self.desired_begin
         
-      # process text nodes
+      # process text nodes. Whether text nodes are retained depends only on the element, and is
+      # therefore determined once instead of for each tail text node.
+
+      self.has_text_nodes = self.ttml_class.is_mixed and self.time_container.is_par()
 
-      if self.ttml_class.is_mixed and xml_elem.text is not None and self.time_container.is_par():
+      if self.has_text_nodes and xml_elem.text is not None:
         self.children.append(ContentElement.make_anonymous_span(self.doc, self.model_element, xml_elem.text))
         self.implicit_end = None
 
-      # process children elements
+    def process_child(self, child_ctx: typing.Optional[ContentElement.ParsingContext], child_xml_elem: et.Element):
+      '''Processes the child element `child_ctx`, once fully processed, and the tail text node of
+      `child_xml_elem`. `child_ctx` is `None` if `child_xml_elem` is not a content element.
+      '''
+      if child_ctx is not None:
 
-      is_inline_animation_complete = False
+        if issubclass(child_ctx.ttml_class, SetElement):
+          if self.is_inline_animation_complete:
+            LOGGER.warning("<set> element is out of order")
+        elif self.is_inline_animation_complete is False:
+          self.is_inline_animation_complete = True
 
-      for child_xml_element in xml_elem:
+        if self.time_container.is_seq():
 
-        if issubclass(self.ttml_class, RegionElement) and StyleElement.is_instance(child_xml_element):
-          # process nest styling, which is specific to region elements, and does not affect temporal
-          # processing
-          StyleElement.from_xml(self, child_xml_element)
-          continue
-
-        child_element = ContentElement.from_xml(self, child_xml_element)
-
-        if child_element is not None:
+          self.implicit_end = None if child_ctx.desired_end is None else child_ctx.desired_end + self.desired_begin
 
-          if issubclass(child_element.ttml_class, SetElement):
-            if is_inline_animation_complete:
-              LOGGER.warning("<set> element is out of order")
-          elif is_inline_animation_complete is False:
-            is_inline_animation_complete = True
+        else:
 
-          if self.time_container.is_seq():
+          if self.implicit_end is not None and child_ctx.desired_end is not None:
 
-            self.implicit_end = None if child_element.desired_end is None else child_element.desired_end + self.desired_begin
+            self.implicit_end = max(self.implicit_end, child_ctx.desired_end)
 
           else:
 
-            if self.implicit_end is not None and child_element.desired_end is not None:
+            self.implicit_end = None
 
-              self.implicit_end = max(self.implicit_end, child_element.desired_end)
+        # skip child if it has no temporal extent
 
-            else:
+        if not issubclass(child_ctx.ttml_class, SetElement) and \
+          (child_ctx.desired_begin is None or child_ctx.desired_end is None or \
+            child_ctx.desired_begin != child_ctx.desired_end):
 
-              self.implicit_end = None
+          self.children.append(child_ctx.model_element)
 
-          # skip child if it has no temporal extent
+      # process tail text node
 
-          if not issubclass(child_element.ttml_class, SetElement) and \
-            (child_element.desired_begin is None or child_element.desired_end is None or \
-              child_element.desired_begin != child_element.desired_end):
+      if self.has_text_nodes and child_xml_elem.tail is not None:
+        self.children.append(
+          ContentElement.make_anonymous_span(
+            self.doc,
+            self.model_element,
+            child_xml_elem.tail
+            )
+          )
+        self.implicit_end = None
 
-            self.children.append(child_element.model_element)
+    # pylint: disable=too-many-branches
 
-        # process tail text node
+    def process_end(self, parent_ctx: TTMLElement.ParsingContext, xml_elem: et.Element):
+      '''Processing performed after the children of `xml_elem` are processed
+      '''
 
-        if self.ttml_class.is_mixed and child_xml_element.tail is not None and self.time_container.is_par():
-          self.children.append(
-            ContentElement.make_anonymous_span(
-              self.doc,
-              self.model_element,
-              child_xml_element.tail
-              )
-            )
-          self.implicit_end = None
+      has_attributes = len(xml_elem.attrib) > 0
 
       # process referential styling last since it has the lowest priority compared to specified and nested styling
 
-      if self.ttml_class.has_styles:
+      if has_attributes and self.ttml_class.has_styles:
 
         self.process_referential_styling(xml_elem)
 
@@ -945,7 +1063,7 @@ def process(self, parent_ctx: TTMLElement.ParsingContext, xml_elem: et.Element):
 
         self.process_set_style_properties(parent_ctx, xml_elem)
 
-      elif self.ttml_class.has_styles:
+      elif has_attributes and self.ttml_class.has_styles:
 
         self.process_specified_styling(xml_elem)
 
@@ -976,6 +1094,12 @@ def from_model_animation(ctx: TTMLElement.WritingContext, model_element: model.C
         xml_element.append(set_element)
 
 
+  @property
+  def model_class(self) -> typing.Type[model.ContentElement]:
+    '''Class of the model element corresponding to the element
+    '''
+    raise NotImplementedError
+
   @property
   def has_timing(self):
     '''`True` if the element supports temporal attributes
@@ -1007,7 +1131,11 @@ def has_children(self):
     raise NotImplementedError
 
   @staticmethod
-  def make_anonymous_span(document, model_element, span_text):
+  def make_anonymous_span(
+    document: model.ContentDocument,
+    model_element: model.ContentElement,
+    span_text: str
+  ) -> typing.Union[model.Span, model.Text]:
     '''Creates an anonymous span in the element `model_element` from the text contained in `span_text`
     '''
     if isinstance(model_element, model.Span):
@@ -1022,35 +1150,52 @@ def make_anonymous_span(document, model_element, span_text):
     return s
 
   @staticmethod
+  def get_ttml_class(xml_elem: et.Element) -> typing.Optional[typing.Type[ContentElement]]:
+    '''Returns the content element class of which the XML element `xml_elem` is an instance, or `None`
+    if `xml_elem` is not a content element.
+    '''
+
+    ttml_elem_class = _CONTENT_CLASSES.get(xml_elem.tag)
+
+    if ttml_elem_class is SpanElement:
+      # span elements are further distinguished by their tts:ruby attribute
+      return _SPAN_CLASSES.get(SpanElement.get_ruby_attr(xml_elem))
+
+    return ttml_elem_class
+
+  @classmethod
+  def make_parsing_context(
+    cls,
+    parent_ctx: TTMLElement.ParsingContext,
+    _xml_elem: et.Element
+  ) -> typing.Optional[ContentElement.ParsingContext]:
+    '''Creates the parsing context of the XML element `xml_elem`, without processing the element, or
+    returns `None` if the element is invalid.
+    '''
+    return cls.ParsingContext(cls, parent_ctx, cls.model_class(parent_ctx.doc))
+
+  @classmethod
   def from_xml(
+    cls,
     parent_ctx: typing.Optional[TTMLElement.ParsingContext],
     xml_elem: et.Element
   ) -> typing.Optional[ContentElement.ParsingContext]:
     '''Converts the XML element `xml_elem` into its representation in the data model.
     `parent_ctx` contains state information passed from parent to child in the TTML hierarchy.
+    The class of `xml_elem` is determined from the element itself if the method is called on `ContentElement`.
     '''
 
-    content_classes = [
-      BodyElement,
-      DivElement,
-      PElement,
-      SpanElement,
-      RubyElement,
-      RbElement,
-      RtElement,
-      RpElement,
-      RbcElement,
-      RtcElement,
-      BrElement,
-      SetElement,
-      RegionElement
-      ]
-
-    for ttml_elem_class in content_classes:
-      if ttml_elem_class.is_instance(xml_elem):
-        return ttml_elem_class.from_xml(parent_ctx, xml_elem)
-    
-    return None
+    ttml_elem_class = ContentElement.get_ttml_class(xml_elem) if cls is ContentElement else cls
+
+    if ttml_elem_class is None:
+      return None
+
+    ttml_elem_ctx = ttml_elem_class.make_parsing_context(parent_ctx, xml_elem)
+
+    if ttml_elem_ctx is not None:
+      ttml_elem_ctx.process(parent_ctx, xml_elem)
+
+    return ttml_elem_ctx
 
   # pylint: disable=too-many-branches
 
@@ -1138,20 +1283,23 @@ class ParsingContext(ContentElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
 
-  qn = f"{{{xml_ns.TTML}}}region"
+    __slots__ = ()
+
+  qn = sys.intern(f"{{{xml_ns.TTML}}}region")
   has_timing = True
   has_region = False
   has_styles = True
   is_mixed = False
   has_children = False
+  model_class = model.Region
 
   @staticmethod
   def is_instance(xml_elem) -> bool:
     return xml_elem.tag == RegionElement.qn
 
   @staticmethod
-  def from_xml(
-    parent_ctx: typing.Optional[TTMLElement.ParsingContext],
+  def make_parsing_context(
+    parent_ctx: TTMLElement.ParsingContext,
     xml_elem: et.Element
   ) -> typing.Optional[RegionElement.ParsingContext]:
     rid = imsc_attr.XMLIDAttribute.extract(xml_elem)
@@ -1160,9 +1308,7 @@ def from_xml(
       LOGGER.error("All regions must have an id")
       return None
 
-    region_ctx = RegionElement.ParsingContext(RegionElement, parent_ctx, model.Region(rid, parent_ctx.doc))
-    region_ctx.process(parent_ctx, xml_elem)
-    return region_ctx
+    return RegionElement.ParsingContext(RegionElement, parent_ctx, model.Region(rid, parent_ctx.doc))
 
   @staticmethod
   def from_model(
@@ -1182,34 +1328,38 @@ class SetElement(ContentElement):
   class ParsingContext(ContentElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
-    def process_lang_attribute(self, parent_ctx: TTMLElement.ParsingContext, xml_elem):
+
+    __slots__ = ()
+
+    def process_lang_attribute(self, parent_ctx: TTMLElement.ParsingContext, xml_elem: et.Element):
       # <set> ignores xml:lang
       pass
 
-    def process_space_attribute(self, parent_ctx: TTMLElement.ParsingContext, xml_elem):
+    def process_space_attribute(self, parent_ctx: TTMLElement.ParsingContext, xml_elem: et.Element):
       # <set> ignores xml:space
       pass
 
-  qn = f"{{{xml_ns.TTML}}}set"
+  qn = sys.intern(f"{{{xml_ns.TTML}}}set")
   has_region = False
   has_styles = False
   has_timing = False
   is_mixed = False
   has_children = False
 
+  # <set> elements animate their parent and have no model element of their own
+
+  model_class = None
+
   @staticmethod
   def is_instance(xml_elem) -> bool:
     return xml_elem.tag == SetElement.qn
 
   @staticmethod
-  def from_xml(
-    parent_ctx: typing.Optional[TTMLElement.ParsingContext],
-    xml_elem: et.Element
-  ) -> typing.Optional[SetElement.ParsingContext]:
-    set_ctx = SetElement.ParsingContext(SetElement, parent_ctx)
-    set_ctx.process(parent_ctx, xml_elem)
-
-    return set_ctx
+  def make_parsing_context(
+    parent_ctx: TTMLElement.ParsingContext,
+    _xml_elem: et.Element
+  ) -> SetElement.ParsingContext:
+    return SetElement.ParsingContext(SetElement, parent_ctx)
 
   @staticmethod
   def from_model(
@@ -1247,26 +1397,20 @@ class ParsingContext(ContentElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
 
-  qn = f"{{{xml_ns.TTML}}}body"
+    __slots__ = ()
+
+  qn = sys.intern(f"{{{xml_ns.TTML}}}body")
   has_region = True
   has_styles = True
   has_timing = True
   is_mixed = False
   has_children = True
+  model_class = model.Body
 
   @staticmethod
   def is_instance(xml_elem) -> bool:
     return xml_elem.tag == BodyElement.qn
 
-  @staticmethod
-  def from_xml(
-    parent_ctx: typing.Optional[TTMLElement.ParsingContext],
-    xml_elem: et.Element
-  ) -> typing.Optional[BodyElement.ParsingContext]:
-    body_ctx = BodyElement.ParsingContext(BodyElement, parent_ctx, model.Body(parent_ctx.doc))
-    body_ctx.process(parent_ctx, xml_elem)
-    return body_ctx
-
   @staticmethod
   def from_model(ctx: TTMLElement.WritingContext, model_element: model.ContentElement):
     return ContentElement.from_model(ctx, model_element)
@@ -1283,26 +1427,20 @@ class ParsingContext(ContentElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
 
-  qn = f"{{{xml_ns.TTML}}}div"
+    __slots__ = ()
+
+  qn = sys.intern(f"{{{xml_ns.TTML}}}div")
   has_region = True
   has_styles = True
   has_timing = True
   is_mixed = False
   has_children = True
+  model_class = model.Div
 
   @staticmethod
   def is_instance(xml_elem) -> bool:
     return xml_elem.tag == DivElement.qn
 
-  @staticmethod
-  def from_xml(
-    parent_ctx: typing.Optional[TTMLElement.ParsingContext],
-    xml_elem: et.Element
-  ) -> typing.Optional[DivElement.ParsingContext]:
-    div_ctx = DivElement.ParsingContext(DivElement, parent_ctx, model.Div(parent_ctx.doc))
-    div_ctx.process(parent_ctx, xml_elem)
-    return div_ctx
-
   @staticmethod
   def from_model(ctx: TTMLElement.WritingContext, model_element: model.ContentElement):
     return ContentElement.from_model(ctx, model_element)
@@ -1319,26 +1457,20 @@ class ParsingContext(ContentElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
 
-  qn = f"{{{xml_ns.TTML}}}p"
+    __slots__ = ()
+
+  qn = sys.intern(f"{{{xml_ns.TTML}}}p")
   has_timing = True
   has_region = True
   has_styles = True
   is_mixed = True
   has_children = True
+  model_class = model.P
 
   @staticmethod
   def is_instance(xml_elem) -> bool:
     return xml_elem.tag == PElement.qn
 
-  @staticmethod
-  def from_xml(
-    parent_ctx: typing.Optional[TTMLElement.ParsingContext],
-    xml_elem: et.Element
-  ) -> typing.Optional[PElement.ParsingContext]:
-    p_ctx = PElement.ParsingContext(PElement, parent_ctx, model.P(parent_ctx.doc))
-    p_ctx.process(parent_ctx, xml_elem)
-    return p_ctx
-
   @staticmethod
   def from_model(ctx: TTMLElement.WritingContext, model_element: model.ContentElement):
     return ContentElement.from_model(ctx, model_element)
@@ -1355,34 +1487,29 @@ class ParsingContext(ContentElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
 
-  qn = f"{{{xml_ns.TTML}}}span"
+    __slots__ = ()
+
+  qn = sys.intern(f"{{{xml_ns.TTML}}}span")
   has_timing = True
   has_region = True
   has_styles = True
   is_mixed = True
   has_children = True
+  model_class = model.Span
+  ruby = None
 
-  ruby_attribute_qn = f"{{{xml_ns.TTS}}}ruby"
+  ruby_attribute_qn = sys.intern(f"{{{xml_ns.TTS}}}ruby")
 
   @staticmethod
-  def is_instance(xml_elem):
+  def is_instance(xml_elem) -> bool:
     return xml_elem.tag == SpanElement.qn and SpanElement.get_ruby_attr(xml_elem) is None
 
   @staticmethod
-  def get_ruby_attr(ttml_span):
+  def get_ruby_attr(ttml_span: et.Element) -> typing.Optional[str]:
     '''extracts the value of the TTML `tts:ruby` attribute from the XML element `ttml_span`
     '''
     return ttml_span.get(SpanElement.ruby_attribute_qn)
 
-  @staticmethod
-  def from_xml(
-    parent_ctx: typing.Optional[TTMLElement.ParsingContext],
-    xml_elem: et.Element
-  ) -> typing.Optional[SpanElement.ParsingContext]:
-    span_ctx = SpanElement.ParsingContext(SpanElement, parent_ctx, model.Span(parent_ctx.doc))
-    span_ctx.process(parent_ctx, xml_elem)
-    return span_ctx
-
   @staticmethod
   def from_model(ctx: TTMLElement.WritingContext, model_element: model.ContentElement):
     return ContentElement.from_model(ctx, model_element)
@@ -1399,27 +1526,21 @@ class ParsingContext(ContentElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
 
-  qn = f"{{{xml_ns.TTML}}}span"
+    __slots__ = ()
+
+  qn = sys.intern(f"{{{xml_ns.TTML}}}span")
   ruby = "container"
   has_timing = True
   has_region = True
   has_styles = True
   is_mixed = False
   has_children = True
+  model_class = model.Ruby
 
   @staticmethod
-  def is_instance(xml_elem):
+  def is_instance(xml_elem) -> bool:
     return xml_elem.tag == SpanElement.qn and SpanElement.get_ruby_attr(xml_elem) == RubyElement.ruby
 
-  @staticmethod
-  def from_xml(
-    parent_ctx: typing.Optional[TTMLElement.ParsingContext],
-    xml_elem: et.Element
-  ) -> typing.Optional[RubyElement.ParsingContext]:
-    ruby_ctx = RubyElement.ParsingContext(RubyElement, parent_ctx, model.Ruby(parent_ctx.doc))
-    ruby_ctx.process(parent_ctx, xml_elem)
-    return ruby_ctx
-
   @staticmethod
   def from_model(ctx: TTMLElement.WritingContext, model_element: model.ContentElement):
     return ContentElement.from_model(ctx, model_element)
@@ -1436,26 +1557,20 @@ class ParsingContext(ContentElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
 
+    __slots__ = ()
+
   ruby = "base"
   has_timing = True
   has_region = True
   has_styles = True
   is_mixed = True
   has_children = True
+  model_class = model.Rb
 
   @staticmethod
-  def is_instance(xml_elem):
+  def is_instance(xml_elem) -> bool:
     return xml_elem.tag == SpanElement.qn and SpanElement.get_ruby_attr(xml_elem) == RbElement.ruby
 
-  @staticmethod
-  def from_xml(
-    parent_ctx: typing.Optional[TTMLElement.ParsingContext],
-    xml_elem: et.Element
-  ) -> typing.Optional[RbElement.ParsingContext]:
-    rb_ctx = RbElement.ParsingContext(RbElement, parent_ctx, model.Rb(parent_ctx.doc))
-    rb_ctx.process(parent_ctx, xml_elem)
-    return rb_ctx
-
   @staticmethod
   def from_model(ctx: TTMLElement.WritingContext, model_element: model.ContentElement):
     return ContentElement.from_model(ctx, model_element)
@@ -1473,26 +1588,20 @@ class ParsingContext(ContentElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
 
+    __slots__ = ()
+
   ruby = "text"
   has_timing = True
   has_region = True
   has_styles = True
   is_mixed = True
   has_children = True
+  model_class = model.Rt
 
   @staticmethod
   def is_instance(xml_elem) -> bool:
     return xml_elem.tag == SpanElement.qn and SpanElement.get_ruby_attr(xml_elem) == RtElement.ruby
 
-  @staticmethod
-  def from_xml(
-    parent_ctx: typing.Optional[TTMLElement.ParsingContext],
-    xml_elem: et.Element
-  ) -> typing.Optional[RtElement.ParsingContext]:
-    rt_ctx = RtElement.ParsingContext(RtElement, parent_ctx, model.Rt(parent_ctx.doc))
-    rt_ctx.process(parent_ctx, xml_elem)
-    return rt_ctx
-
   @staticmethod
   def from_model(ctx: TTMLElement.WritingContext, model_element: model.ContentElement):
     return ContentElement.from_model(ctx, model_element)
@@ -1510,26 +1619,20 @@ class ParsingContext(ContentElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
 
+    __slots__ = ()
+
   ruby = "delimiter"
   has_timing = True
   has_region = True
   has_styles = True
   is_mixed = True
   has_children = True
+  model_class = model.Rp
 
   @staticmethod
-  def is_instance(xml_elem):
+  def is_instance(xml_elem) -> bool:
     return xml_elem.tag == SpanElement.qn and SpanElement.get_ruby_attr(xml_elem) == RpElement.ruby
 
-  @staticmethod
-  def from_xml(
-    parent_ctx: typing.Optional[TTMLElement.ParsingContext],
-    xml_elem: et.Element
-  ) -> typing.Optional[RpElement.ParsingContext]:
-    rp_ctx = RpElement.ParsingContext(RpElement, parent_ctx, model.Rp(parent_ctx.doc))
-    rp_ctx.process(parent_ctx, xml_elem)
-    return rp_ctx
-
   @staticmethod
   def from_model(ctx: TTMLElement.WritingContext, model_element: model.ContentElement):
     return ContentElement.from_model(ctx, model_element)
@@ -1547,26 +1650,20 @@ class ParsingContext(ContentElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
 
+    __slots__ = ()
+
   ruby = "baseContainer"
   has_timing = True
   has_region = True
   has_styles = True
   is_mixed = False
   has_children = True
+  model_class = model.Rbc
 
   @staticmethod
   def is_instance(xml_elem) -> bool:
     return xml_elem.tag == SpanElement.qn and SpanElement.get_ruby_attr(xml_elem) == RbcElement.ruby
 
-  @staticmethod
-  def from_xml(
-    parent_ctx: typing.Optional[TTMLElement.ParsingContext],
-    xml_elem: et.Element
-  ) -> typing.Optional[RbcElement.ParsingContext]:
-    rbc_ctx = RbcElement.ParsingContext(RbcElement, parent_ctx, model.Rbc(parent_ctx.doc))
-    rbc_ctx.process(parent_ctx, xml_elem)
-    return rbc_ctx
-
   @staticmethod
   def from_model(ctx: TTMLElement.WritingContext, model_element: model.ContentElement):
     return ContentElement.from_model(ctx, model_element)
@@ -1584,26 +1681,20 @@ class ParsingContext(ContentElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
 
+    __slots__ = ()
+
   ruby = "textContainer"
   has_timing = True
   has_region = True
   has_styles = True
   is_mixed = False
   has_children = True
+  model_class = model.Rtc
 
   @staticmethod
   def is_instance(xml_elem) -> bool:
     return xml_elem.tag == SpanElement.qn and SpanElement.get_ruby_attr(xml_elem) == RtcElement.ruby
 
-  @staticmethod
-  def from_xml(
-    parent_ctx: typing.Optional[TTMLElement.ParsingContext],
-    xml_elem: et.Element
-  ) -> typing.Optional[RtcElement.ParsingContext]:
-    rtc_ctx = RtcElement.ParsingContext(RtcElement, parent_ctx, model.Rtc(parent_ctx.doc))
-    rtc_ctx.process(parent_ctx, xml_elem)
-    return rtc_ctx
-
   @staticmethod
   def from_model(ctx: TTMLElement.WritingContext, model_element: model.ContentElement):
     return ContentElement.from_model(ctx, model_element)
@@ -1621,26 +1712,20 @@ class ParsingContext(ContentElement.ParsingContext):
     '''Maintains state when parsing the element
     '''
 
-  qn = f"{{{xml_ns.TTML}}}br"
+    __slots__ = ()
+
+  qn = sys.intern(f"{{{xml_ns.TTML}}}br")
   has_timing = False
   has_region = False
   has_styles = True
   is_mixed = False
   has_children = False
+  model_class = model.Br
 
   @staticmethod
   def is_instance(xml_elem) -> bool:
     return xml_elem.tag == BrElement.qn
 
-  @staticmethod
-  def from_xml(
-    parent_ctx: typing.Optional[TTMLElement.ParsingContext],
-    xml_elem: et.Element
-  ) -> typing.Optional[BrElement.ParsingContext]:
-    br_ctx = BrElement.ParsingContext(BrElement, parent_ctx, model.Br(parent_ctx.doc))
-    br_ctx.process(parent_ctx, xml_elem)
-    return br_ctx
-
   @staticmethod
   def from_model(
     ctx: TTMLElement.WritingContext,
@@ -1651,3 +1736,48 @@ def from_model(
   @classmethod
   def make_ttml_element(cls):
     return et.Element(cls.qn)
+
+
+#
+# dispatch tables of the children of the tt and head elements, which map the qualified name of each
+# child element to its local name and handler
+#
+
+_TT_CHILDREN = {
+  HeadElement.qn: ("head", TTElement.process_head_element),
+  BodyElement.qn: ("body", TTElement.process_body_element)
+}
+
+_HEAD_CHILDREN = {
+  LayoutElement.qn: ("layout", LayoutElement.from_xml),
+  StylingElement.qn: ("styling", StylingElement.from_xml)
+}
+
+#
+# dispatch tables of content elements, which map the qualified name of each element, and the value of
+# the tts:ruby attribute of span elements, to the corresponding class
+#
+
+_CONTENT_CLASSES = {
+  ttml_elem_class.qn: ttml_elem_class for ttml_elem_class in (
+    BodyElement,
+    DivElement,
+    PElement,
+    SpanElement,
+    BrElement,
+    SetElement,
+    RegionElement
+  )
+}
+
+_SPAN_CLASSES = {
+  ttml_elem_class.ruby: ttml_elem_class for ttml_elem_class in (
+    SpanElement,
+    RubyElement,
+    RbElement,
+    RtElement,
+    RpElement,
+    RbcElement,
+    RtcElement
+  )
+}
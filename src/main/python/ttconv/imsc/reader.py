@@ -27,8 +27,8 @@
 
 import logging
 import typing
-
 import ttconv.imsc.elements as imsc_elements
+import ttconv.imsc.xml_backend as xml_backend
 import ttconv.model as model
 
 LOGGER = logging.getLogger(__name__)
@@ -50,4 +50,127 @@ def to_model(xml_tree, progress_callback=lambda _: None) -> typing.Optional[mode
     return None 
 
   return tt_element.doc
-  
\ No newline at end of file
+
+
+def to_model_stream(source, progress_callback=lambda _: None) -> typing.Optional[model.ContentDocument]:
+  '''Converts an IMSC document read from `source`, a file name or file object, to the data model.
+
+  Unlike `to_model()`, the document is not held in memory in its entirety: the children of the
+  `body` and `div` elements are converted as soon as they are parsed, after which their XML
+  representation is discarded.
+  '''
+
+  tt_xml_element = None
+  tt_ctx = None
+
+  # names of the children of the tt element that have been processed
+
+  processed_children = set()
+
+  head_xml_element = None
+
+  # body and div elements whose children are being parsed, as (context, parent context, XML element) tuples
+
+  open_elements = []
+
+  depth = 0
+
+  for event, xml_element in xml_backend.iterparse(source, events=("start", "end")):
+
+    if event == "start":
+
+      depth += 1
+
+      if depth == 1:
+
+        if not imsc_elements.TTElement.is_instance(xml_element):
+          LOGGER.fatal("A tt element is not the root element")
+          return None
+
+        tt_xml_element = xml_element
+
+        tt_ctx = imsc_elements.TTElement.make_parsing_context(xml_element)
+
+      elif depth == 2:
+
+        if imsc_elements.TTElement.child_handler(processed_children, xml_element) is None:
+          continue
+
+        if imsc_elements.HeadElement.is_instance(xml_element):
+          head_xml_element = xml_element
+          continue
+
+        body_ctx = imsc_elements.BodyElement.make_parsing_context(tt_ctx, xml_element)
+        body_ctx.process_begin(tt_ctx, xml_element)
+        open_elements.append((body_ctx, tt_ctx, xml_element))
+
+      elif len(open_elements) > 0 and depth == len(open_elements) + 2 and imsc_elements.DivElement.is_instance(xml_element):
+
+        parent_ctx = open_elements[-1][0]
+
+        div_ctx = imsc_elements.DivElement.make_parsing_context(parent_ctx, xml_element)
+        div_ctx.process_begin(parent_ctx, xml_element)
+        open_elements.append((div_ctx, parent_ctx, xml_element))
+
+      continue
+
+    # end event
+
+    element_depth = depth
+
+    depth -= 1
+
+    if len(open_elements) > 0 and open_elements[-1][2] is xml_element:
+
+      # the children of a body or div element have all been processed
+
+      element_ctx, parent_ctx, _ = open_elements.pop()
+
+      element_ctx.process_end(parent_ctx, xml_element)
+
+      if len(open_elements) > 0:
+
+        parent_xml_element = open_elements[-1][2]
+
+        parent_ctx.process_child(element_ctx, xml_element)
+
+      else:
+
+        parent_xml_element = tt_xml_element
+
+        tt_ctx.doc.set_body(element_ctx.model_element)
+
+        progress_callback(1)
+
+    elif len(open_elements) > 0 and element_depth == len(open_elements) + 2:
+
+      # any other child of a body or div element is processed in its entirety
+
+      parent_ctx, _, parent_xml_element = open_elements[-1]
+
+      parent_ctx.process_child(imsc_elements.ContentElement.from_xml(parent_ctx, xml_element), xml_element)
+
+    elif element_depth == 2:
+
+      parent_xml_element = tt_xml_element
+
+      if xml_element is head_xml_element:
+
+        imsc_elements.TTElement.process_head_element(tt_ctx, xml_element, progress_callback)
+
+    else:
+
+      # descendant of an element that has not yet been processed
+
+      continue
+
+    # release the XML element once it has been processed
+
+    xml_element.clear()
+    parent_xml_element.remove(xml_element)
+
+  if tt_ctx is None:
+    LOGGER.fatal("Invalid TT element")
+    return None
+
+  return tt_ctx.doc
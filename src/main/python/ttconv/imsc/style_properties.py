@@ -25,8 +25,9 @@
 
 '''IMSC style properties'''
 
-import inspect
+import functools
 import math
+import sys
 import typing
 import ttconv.imsc.namespaces as xml_ns
 import ttconv.utils
@@ -34,7 +35,22 @@
 import ttconv.imsc.utils as utils
 import ttconv.model as model
 
+# maps TTML length units to model length units, avoiding an Enum lookup for each length
+
+_LENGTH_UNITS = {units.value: units for units in styles.LengthType.Units}
+
+@functools.lru_cache(maxsize=512)
+def _parse_length(xml_attrib: str) -> styles.LengthType:
+  '''Converts a TTML length to the model. Documents typically repeat the same few lengths, and
+  LengthType instances are immutable, so results are cached and shared.
+  '''
+  (value, units) = utils.parse_length(xml_attrib)
+
+  return styles.LengthType(value, _LENGTH_UNITS[units])
+
 class StyleParsingContext:
+  __slots__ = ("doc",)
+
   doc: model.ContentDocument
 
 class StyleProperty:
@@ -1125,20 +1141,55 @@ def from_model(cls, xml_element, model_value: styles.WritingModeType):
 
 
   BY_QNAME = {
-    f"{{{style_prop.ns}}}{style_prop.local_name}" : style_prop
-    for style_name, style_prop in list(locals().items()) if inspect.isclass(style_prop)
+    sys.intern(f"{{{style_prop.ns}}}{style_prop.local_name}") : style_prop
+    for style_prop in (
+      BackgroundColor,
+      Color,
+      Direction,
+      Disparity,
+      Display,
+      DisplayAlign,
+      Extent,
+      FillLineGap,
+      FontFamily,
+      FontSize,
+      FontStyle,
+      FontWeight,
+      LineHeight,
+      LinePadding,
+      LuminanceGain,
+      MultiRowAlign,
+      Opacity,
+      Origin,
+      Overflow,
+      Padding,
+      Position,
+      RubyAlign,
+      RubyPosition,
+      RubyReserve,
+      Shear,
+      ShowBackground,
+      TextAlign,
+      TextCombine,
+      TextDecoration,
+      TextEmphasis,
+      TextOutline,
+      TextShadow,
+      UnicodeBidi,
+      Visibility,
+      WrapOption,
+      WritingMode,
+      )
     }
 
   BY_MODEL_PROP = {
     style_prop.model_prop : style_prop
-    for style_name, style_prop in list(locals().items()) if inspect.isclass(style_prop) and style_prop.model_prop is not None
+    for style_prop in BY_QNAME.values() if style_prop.model_prop is not None
     }
 
   @classmethod
   def ttml_length_to_model(cls, _context: StyleParsingContext, xml_attrib: str):
-    (value, units) = utils.parse_length(xml_attrib)
-
-    return styles.LengthType(value, styles.LengthType.Units(units))
+    return _parse_length(xml_attrib)
 
   @staticmethod
   def to_ttml_color(model_value: styles.ColorType):
@@ -30,28 +30,45 @@
 from fractions import Fraction
 import ttconv.style_properties as styles
 
-_LENGTH_RE = re.compile(r"^((?:\+|\-)?\d*(?:\.\d+)?)(px|em|c|%|rh|rw)$")
+_ONE_CHAR_LENGTH_UNITS = frozenset(("c", "%"))
+_TWO_CHAR_LENGTH_UNITS = frozenset(("px", "em", "rh", "rw"))
 
-_CLOCK_TIME_FRACTION_RE = re.compile(r"^(\d{2,}):(\d\d):(\d\d(?:\.\d+)?)$")
-_CLOCK_TIME_FRAMES_RE = re.compile(r"^(\d{2,}):(\d\d):(\d\d):(\d{2,})$")
-_OFFSET_FRAME_RE = re.compile(r"^(\d+(?:\.\d+)?)f")
-_OFFSET_TICK_RE = re.compile(r"^(\d+(?:\.\d+)?)t$")
-_OFFSET_MS_RE = re.compile(r"^(\d+(?:\.\d+)?)ms$")
-_OFFSET_S_RE = re.compile(r"^(\d+(?:\.\d+)?)s$")
-_OFFSET_H_RE = re.compile(r"^(\d+(?:\.\d+)?)h$")
-_OFFSET_M_RE = re.compile(r"^(\d+(?:\.\d+)?)m$")
+_CLOCK_TIME_FRACTION_MATCH = re.compile(r"^(\d{2,}):(\d\d):(\d\d(?:\.\d+)?)$").match
+_CLOCK_TIME_FRAMES_MATCH = re.compile(r"^(\d{2,}):(\d\d):(\d\d):(\d{2,})$").match
+_OFFSET_FRAME_MATCH = re.compile(r"^(\d+(?:\.\d+)?)f").match
+_OFFSET_TICK_MATCH = re.compile(r"^(\d+(?:\.\d+)?)t$").match
+_OFFSET_MS_MATCH = re.compile(r"^(\d+(?:\.\d+)?)ms$").match
+_OFFSET_S_MATCH = re.compile(r"^(\d+(?:\.\d+)?)s$").match
+_OFFSET_H_MATCH = re.compile(r"^(\d+(?:\.\d+)?)h$").match
+_OFFSET_M_MATCH = re.compile(r"^(\d+(?:\.\d+)?)m$").match
 
 
 def parse_length(attr_value: str) -> typing.Tuple[float, str]:
   '''Parses the TTML length in `attr_value` into a (length, units) tuple'''
 
-  m = _LENGTH_RE.match(attr_value)
+  # hand-written equivalent of the regular expression `^([+-]?\d*(?:\.\d+)?)(px|em|c|%|rh|rw)$`, which
+  # is slower on such short strings
 
-  if m:
+  units = attr_value[-1:]
+
+  if units not in _ONE_CHAR_LENGTH_UNITS:
+
+    units = attr_value[-2:]
+
+    if units not in _TWO_CHAR_LENGTH_UNITS:
+      raise ValueError("Bad length syntax")
+
+  number = attr_value[:-len(units)]
 
-    return (float(m.group(1)), m.group(2))
+  if not number.isdecimal():
 
-  raise ValueError("Bad length syntax")
+    integer_part, dot, fraction_part = (number[1:] if number[:1] in ("+", "-") else number).partition(".")
+
+    if not (integer_part.isdecimal() or (integer_part == "" and dot != "")) or \
+      not (dot == "" or fraction_part.isdecimal()):
+      raise ValueError("Bad length syntax")
+
+  return (float(number), units)
 
 
 _FAMILIES_ESCAPED_CHAR = re.compile(r"\\(.)")
@@ -104,58 +121,62 @@ def _serialize_one_family(family):
   return ", ".join(map(_serialize_one_family, font_family))
 
 
+def _decimal_to_fraction(value: str) -> Fraction:
+  '''Converts a decimal number matched by the time expression regular expressions, avoiding
+  `Fraction(str)`, which is much slower than `int()`, when `value` is an integer
+  '''
+  return Fraction(int(value)) if value.isdecimal() else Fraction(value)
+
 def parse_time_expression(tick_rate: typing.Optional[int], frame_rate: typing.Optional[Fraction], time_expr: str) -> Fraction:
   '''Parse a TTML time expression in a fractional number in seconds
   '''
 
-  m = _OFFSET_FRAME_RE.match(time_expr)
+  m = _OFFSET_FRAME_MATCH(time_expr)
 
   if m and frame_rate is not None:
-    return Fraction(m.group(1)) / frame_rate
+    return _decimal_to_fraction(m.group(1)) / frame_rate
 
-  m = _OFFSET_TICK_RE.match(time_expr)
+  m = _OFFSET_TICK_MATCH(time_expr)
 
   if m and tick_rate is not None:
-    return Fraction(m.group(1)) / tick_rate
+    return _decimal_to_fraction(m.group(1)) / tick_rate
 
-  m = _OFFSET_MS_RE.match(time_expr)
+  m = _OFFSET_MS_MATCH(time_expr)
 
   if m:
-    return Fraction(m.group(1)) / 1000
+    return _decimal_to_fraction(m.group(1)) / 1000
 
-  m = _OFFSET_S_RE.match(time_expr)
+  m = _OFFSET_S_MATCH(time_expr)
 
   if m:
-    return Fraction(m.group(1))
+    return _decimal_to_fraction(m.group(1))
 
-  m = _OFFSET_M_RE.match(time_expr)
+  m = _OFFSET_M_MATCH(time_expr)
 
   if m:
-    return Fraction(m.group(1)) * 60
+    return _decimal_to_fraction(m.group(1)) * 60
 
-  m = _OFFSET_H_RE.match(time_expr)
+  m = _OFFSET_H_MATCH(time_expr)
 
   if m:
-    return Fraction(m.group(1)) * 3600
+    return _decimal_to_fraction(m.group(1)) * 3600
 
-  m = _CLOCK_TIME_FRACTION_RE.match(time_expr)
+  m = _CLOCK_TIME_FRACTION_MATCH(time_expr)
 
   if m:
-    return Fraction(m.group(1)) * 3600 + \
-            Fraction(m.group(2)) * 60 + \
-            Fraction(m.group(3))
+    return int(m.group(1)) * 3600 + \
+            int(m.group(2)) * 60 + \
+            _decimal_to_fraction(m.group(3))
   
-  m = _CLOCK_TIME_FRAMES_RE.match(time_expr)
+  m = _CLOCK_TIME_FRAMES_MATCH(time_expr)
 
   if m and frame_rate is not None:
-    frames = Fraction(m.group(4)) if m.group(4) else 0
+    frames = int(m.group(4))
 
     if frames >= frame_rate:
       raise ValueError("Frame cound exceeds frame rate")
 
-    return Fraction(m.group(1)) * 3600 + \
-            Fraction(m.group(2)) * 60 + \
-            Fraction(m.group(3)) + \
+    return Fraction(int(m.group(1)) * 3600 + int(m.group(2)) * 60 + int(m.group(3))) + \
             frames / frame_rate
 
   raise ValueError("Syntax error")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2020, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''XML parser used by the IMSC reader: lxml if it is installed, the standard library otherwise'''
+
+import xml.etree.ElementTree as et
+
+try:
+  from lxml.etree import LXML_VERSION, XMLParser, XMLPullParser, XMLSyntaxError
+
+  # lxml 5 is the first version that supports expanding only internal entities
+
+  HAS_LXML = LXML_VERSION >= (5,)
+
+except ImportError:
+
+  HAS_LXML = False
+
+# Exception raised by both parsers when a document is not well-formed
+
+ParseError = et.ParseError
+
+# The lxml options are chosen so that both parsers accept the same documents and produce the same
+# element trees:
+#
+# - lxml reports comments and processing instructions as elements, whereas the standard library
+#   parser discards them.
+# - Both parsers expand internal entities and neither reads external entities.
+# - libxml2 rejects documents nested more than 256 levels deep or containing text nodes longer than
+#   10 MB, which the standard library parser accepts. huge_tree lifts these limits, but not the
+#   protection against entity amplification, which both parsers keep.
+# - libxml2 rejects duplicate xml:id values, which the reader instead reports and skips.
+
+_LXML_OPTIONS = {
+  "remove_comments": True,
+  "remove_pis": True,
+  "resolve_entities": "internal",
+  "huge_tree": True,
+  "collect_ids": False
+}
+
+_READ_SIZE = 64 * 1024
+
+def _read_chunks(source):
+  '''Yields successive chunks of `source`, a file name or a binary or text file object'''
+  if not hasattr(source, "read"):
+    with open(source, "rb") as f:
+      yield from _read_chunks(f)
+    return
+
+  while True:
+    chunk = source.read(_READ_SIZE)
+    if not chunk:
+      return
+    yield chunk
+
+def _to_parse_error(error) -> ParseError:
+  '''Converts the lxml exception `error` to the exception raised by the standard library parser'''
+  parse_error = ParseError(str(error))
+  parse_error.position = error.position
+  return parse_error
+
+def parse(source):
+  '''Parses the XML document at `source`, a file name or a binary or text file object, into an element
+  tree suitable for `ttconv.imsc.reader.to_model()`. Raises `ParseError` if the document is not well-formed.
+  '''
+  if not HAS_LXML:
+    return et.parse(source)
+
+  # lxml's feed parsers accept both bytes and str, unlike lxml.etree.parse() and lxml.etree.iterparse()
+
+  parser = XMLParser(**_LXML_OPTIONS)
+
+  try:
+    for chunk in _read_chunks(source):
+      parser.feed(chunk)
+    return parser.close().getroottree()
+
+  except XMLSyntaxError as e:
+    raise _to_parse_error(e) from e
+
+def _lxml_iterparse(source, events):
+  parser = XMLPullParser(events=events, **_LXML_OPTIONS)
+
+  try:
+    for chunk in _read_chunks(source):
+      parser.feed(chunk)
+      yield from parser.read_events()
+    parser.close()
+
+  except XMLSyntaxError as e:
+    raise _to_parse_error(e) from e
+
+  yield from parser.read_events()
+
+def iterparse(source, events=("end",)):
+  '''Incrementally parses the XML document at `source`, a file name or a binary or text file object,
+  returning an iterator of (event, element) pairs. The iterator raises `ParseError` if the document is
+  not well-formed.
+  '''
+  if HAS_LXML:
+    return _lxml_iterparse(source, events)
+
+  return et.iterparse(source, events=events)
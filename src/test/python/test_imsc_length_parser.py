@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Copyright (c) 2020, Sandflow Consulting LLC
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR
+# ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+'''Unit tests for the IMSC \\<length\\> parser'''
+
+# pylint: disable=C0115,C0116
+
+import unittest
+from ttconv.imsc.utils import parse_length
+from ttconv.imsc.style_properties import StyleProperties, _parse_length
+import ttconv.style_properties as styles
+
+class IMSCLengthParserTest(unittest.TestCase):
+
+  _parse_tests = [
+    ["1.25c", (1.25, "c")],
+    ["100%", (100, "%")],
+    ["-12.5px", (-12.5, "px")],
+    ["+2em", (2, "em")],
+    [".5rh", (0.5, "rh")],
+    ["-.5rw", (-0.5, "rw")],
+    ["0px", (0, "px")]
+  ]
+
+  def test_parse_length(self):
+    for test in self._parse_tests:
+      with self.subTest(test[0]):
+        self.assertEqual(parse_length(test[0]), test[1])
+
+  _bad_tests = [
+    "",
+    "px",
+    "+px",
+    "1",
+    "1.5",
+    "1.px",
+    "1..5px",
+    "1e5px",
+    "infpx",
+    "1_0px",
+    " 1px",
+    "1 px",
+    "1pt",
+    "--1px"
+  ]
+
+  def test_parse_bad_length(self):
+    for test in self._bad_tests:
+      with self.subTest(test):
+        with self.assertRaises(ValueError):
+          parse_length(test)
+
+  def test_length_to_model(self):
+    _parse_length.cache_clear()
+
+    length = StyleProperties.ttml_length_to_model(None, "1.25c")
+
+    self.assertEqual(length, styles.LengthType(1.25, styles.LengthType.Units.c))
+
+    # repeated lengths are shared
+
+    self.assertIs(StyleProperties.ttml_length_to_model(None, "1.25c"), length)
+
+    self.assertEqual(_parse_length.cache_info().hits, 1)
+
+    # invalid lengths are not cached
+
+    for _ in range(2):
+      with self.assertRaises(ValueError):
+        StyleProperties.ttml_length_to_model(None, "1.25pt")
+
+    self.assertEqual(_parse_length.cache_info().hits, 1)
+
+    self.assertEqual(_parse_length.cache_info().currsize, 1)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -29,13 +29,22 @@
 
 import unittest
 import xml.etree.ElementTree as et
+import io
 import os
+import sys
 import logging
 from fractions import Fraction
+from unittest import mock
 import ttconv.model as model
 import ttconv.style_properties as styles
 import ttconv.imsc.reader as imsc_reader
+import ttconv.imsc.writer as imsc_writer
 import ttconv.imsc.style_properties as imsc_styles
+import ttconv.imsc.xml_backend as xml_backend
+
+def use_lxml_values():
+  '''Values of `xml_backend.HAS_LXML` under which the XML backend is tested'''
+  return (False, True) if xml_backend.HAS_LXML else (False,)
 
 class IMSCReaderTest(unittest.TestCase):
 
@@ -259,16 +268,207 @@ def test_text_emphasis(self):
     self.assertEqual(value.style, styles.TextEmphasisType.Style.open_circle)
     self.assertEqual(value.position, styles.TextEmphasisType.Position.before)
 
+  def test_style_property_registry(self):
+    self.assertSetEqual(
+      set(imsc_styles.StyleProperties.BY_QNAME.values()),
+      set(v for v in vars(imsc_styles.StyleProperties).values() if isinstance(v, type))
+    )
+    self.assertSetEqual(set(imsc_styles.StyleProperties.BY_MODEL_PROP), set(styles.StyleProperties.ALL))
+
   def test_cell_resolution(self):
+    # characters following the rows are ignored
+    for cr in ("32 15", "32 15 ", "32 15 1"):
+      xml_str = f"""<?xml version="1.0" encoding="UTF-8"?>
+      <tt xml:lang="en"
+          xmlns="http://www.w3.org/ns/ttml"
+          xmlns:ttp="http://www.w3.org/ns/ttml#parameter"
+          ttp:cellResolution="{cr}">
+      </tt>"""
+      with self.subTest(cr):
+        doc = imsc_reader.to_model(et.ElementTree(et.fromstring(xml_str)))
+        self.assertEqual(doc.get_cell_resolution().columns, 32)
+        self.assertEqual(doc.get_cell_resolution().rows, 15)
+
+  def test_frame_rate_multiplier_trailing_space(self):
     xml_str = """<?xml version="1.0" encoding="UTF-8"?>
     <tt xml:lang="en"
         xmlns="http://www.w3.org/ns/ttml"
         xmlns:ttp="http://www.w3.org/ns/ttml#parameter"
-        ttp:cellResolution="32 15">
+        ttp:frameRate="30"
+        ttp:frameRateMultiplier="1000 1001 ">
+    <body begin="30f"/>
     </tt>"""
     doc = imsc_reader.to_model(et.ElementTree(et.fromstring(xml_str)))
-    self.assertEqual(doc.get_cell_resolution().columns, 32)
-    self.assertEqual(doc.get_cell_resolution().rows, 15)
+    self.assertEqual(doc.get_body().get_begin(), Fraction(1001, 1000))
+
+  def test_bad_cell_resolution(self):
+    for cr in ("32", "32  15", "a 15", "32 -15", ""):
+      xml_str = f"""<?xml version="1.0" encoding="UTF-8"?>
+      <tt xml:lang="en"
+          xmlns="http://www.w3.org/ns/ttml"
+          xmlns:ttp="http://www.w3.org/ns/ttml#parameter"
+          ttp:cellResolution="{cr}">
+      </tt>"""
+      with self.assertLogs() as logs:
+        doc = imsc_reader.to_model(et.ElementTree(et.fromstring(xml_str)))
+      self.assertEqual(logs.records[0].getMessage(), "ttp:cellResolution invalid syntax")
+      self.assertEqual(doc.get_cell_resolution().columns, 32)
+      self.assertEqual(doc.get_cell_resolution().rows, 15)
+
+  def test_deeply_nested_elements(self):
+    depth = 2 * sys.getrecursionlimit()
+
+    xml_str = f"""<?xml version="1.0" encoding="UTF-8"?>
+    <tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml">
+    <body>{"<div>" * depth}<p>hello</p>{"</div>" * depth}</body>
+    </tt>"""
+
+    doc = imsc_reader.to_model(et.ElementTree(et.fromstring(xml_str)))
+
+    element = doc.get_body()
+    for _ in range(depth):
+      element = element.first_child()
+      self.assertIsInstance(element, model.Div)
+
+    self.assertIsInstance(element.first_child(), model.P)
+
+  def test_stream_tt_element_not_root_element(self):
+    xml_str = """<?xml version="1.0" encoding="UTF-8"?>
+      <not_tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml"/>"""
+
+    self.assertIsNone(imsc_reader.to_model_stream(io.StringIO(xml_str)))
+
+  def test_stream_matches_tree(self):
+    xml_str = """<?xml version="1.0" encoding="UTF-8"?>
+      <tt xml:lang="en"
+          xmlns="http://www.w3.org/ns/ttml"
+          xmlns:tts="http://www.w3.org/ns/ttml#styling"
+          xmlns:ttp="http://www.w3.org/ns/ttml#parameter"
+          ttp:frameRate="25">
+      <head>
+        <styling>
+          <style xml:id="s1" tts:color="red"/>
+        </styling>
+        <layout>
+          <region xml:id="r1" tts:extent="80% 20%"/>
+        </layout>
+      </head>
+      <body region="r1" style="s1">
+        <div timeContainer="seq">
+          <p dur="2s">Hello <span tts:color="green">world</span><!-- comment --><br/>again<?pi?> and again</p>
+          <p dur="30f">seq <set begin="1s" end="2s" tts:color="white"/></p>
+          <div><p begin="1s" end="2s">nested</p></div>
+        </div>
+        <div begin="10s" end="12s">
+          <p><span tts:ruby="container"><span tts:ruby="base">B</span><span tts:ruby="text">T</span></span></p>
+        </div>
+      </body>
+      </tt>"""
+
+    ttml_files = [
+      'src/test/resources/ttml/body_only.ttml',
+      'src/test/resources/ttml/lwsp_default.ttml',
+      'src/test/resources/ttml/lwsp_preserve.ttml',
+      'src/test/resources/ttml/referential_styling.ttml',
+    ]
+
+    sources = [(f, lambda f=f: f) for f in ttml_files]
+    sources.append(("inline", lambda: io.StringIO(xml_str)))
+
+    for name, source in sources:
+      tree_xml = et.tostring(imsc_writer.from_model(imsc_reader.to_model(et.parse(source()))).getroot())
+
+      for use_lxml in use_lxml_values():
+        with self.subTest(name, lxml=use_lxml), mock.patch.object(xml_backend, "HAS_LXML", use_lxml):
+          stream_doc = imsc_reader.to_model_stream(source())
+          backend_doc = imsc_reader.to_model(xml_backend.parse(source()))
+
+          self.assertEqual(tree_xml, et.tostring(imsc_writer.from_model(stream_doc).getroot()))
+          self.assertEqual(tree_xml, et.tostring(imsc_writer.from_model(backend_doc).getroot()))
+
+  def test_stream_duplicate_children(self):
+    xml_str = """<?xml version="1.0" encoding="UTF-8"?>
+      <tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml">
+      <head/>
+      <body><div><p>first</p></div></body>
+      <head/>
+      <body><div><p>second</p></div></body>
+      </tt>"""
+
+    with self.assertLogs() as tree_logs:
+      tree_doc = imsc_reader.to_model(et.ElementTree(et.fromstring(xml_str)))
+
+    with self.assertLogs() as stream_logs:
+      stream_doc = imsc_reader.to_model_stream(io.StringIO(xml_str))
+
+    self.assertEqual(
+      [record.getMessage() for record in tree_logs.records],
+      [record.getMessage() for record in stream_logs.records]
+    )
+    self.assertIn("More than one body element present", [record.getMessage() for record in stream_logs.records])
+
+    self.assertEqual(
+      et.tostring(imsc_writer.from_model(tree_doc).getroot()),
+      et.tostring(imsc_writer.from_model(stream_doc).getroot())
+    )
+
+
+class XMLBackendTest(unittest.TestCase):
+
+  def assert_same_model(self, xml_str):
+    tree_xml = et.tostring(imsc_writer.from_model(imsc_reader.to_model(et.ElementTree(et.fromstring(xml_str)))).getroot())
+
+    sources = (("str", lambda: io.StringIO(xml_str)), ("bytes", lambda: io.BytesIO(xml_str.encode("utf-8"))))
+
+    for use_lxml in use_lxml_values():
+      for name, source in sources:
+        with self.subTest(name, lxml=use_lxml), mock.patch.object(xml_backend, "HAS_LXML", use_lxml):
+          stream_doc = imsc_reader.to_model_stream(source())
+          backend_doc = imsc_reader.to_model(xml_backend.parse(source()))
+
+          self.assertEqual(tree_xml, et.tostring(imsc_writer.from_model(stream_doc).getroot()))
+          self.assertEqual(tree_xml, et.tostring(imsc_writer.from_model(backend_doc).getroot()))
+
+  def test_parse_error(self):
+    xml_str = """<?xml version="1.0" encoding="UTF-8"?>
+      <tt xml:lang="en" xml:lang="fr" xmlns="http://www.w3.org/ns/ttml"/>"""
+
+    for use_lxml in use_lxml_values():
+      with self.subTest(lxml=use_lxml), mock.patch.object(xml_backend, "HAS_LXML", use_lxml):
+        with self.assertRaises(et.ParseError):
+          xml_backend.parse(io.StringIO(xml_str))
+
+        with self.assertRaises(et.ParseError):
+          imsc_reader.to_model_stream(io.StringIO(xml_str))
+
+  def test_internal_entity(self):
+    self.assert_same_model("""<?xml version="1.0" encoding="UTF-8"?>
+      <!DOCTYPE tt [<!ENTITY foo "Hello">]>
+      <tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml">
+      <body><div><p>&foo; world</p></div></body>
+      </tt>""")
+
+  def test_deeply_nested_elements(self):
+    self.assert_same_model(f"""<?xml version="1.0" encoding="UTF-8"?>
+      <tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml">
+      <body>{"<div>" * 300}<p>hello</p>{"</div>" * 300}</body>
+      </tt>""")
+
+  def test_duplicate_id(self):
+    xml_str = """<?xml version="1.0" encoding="UTF-8"?>
+      <tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml" xmlns:tts="http://www.w3.org/ns/ttml#styling">
+      <head>
+        <styling>
+          <style xml:id="s1" tts:color="red"/>
+          <style xml:id="s1" tts:color="green"/>
+        </styling>
+      </head>
+      <body><div><p style="s1">hello</p></div></body>
+      </tt>"""
+
+    with self.assertLogs() as logs:
+      self.assert_same_model(xml_str)
+    self.assertIn("Duplicate style id", [record.getMessage() for record in logs.records])
 
 if __name__ == '__main__':
   unittest.main()